@@ -1,20 +1,119 @@
 import pandas as pd
+import numpy as np
 import re
 import logging
-from typing import Dict, List, Any, Optional
+import functools
+import csv
+import os
+import unicodedata
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass
 
-@dataclass
+try:
+    import ahocorasick  # pyahocorasick（任意依存）
+except ImportError:
+    ahocorasick = None
+
+try:
+    from joblib import Parallel, delayed  # joblib（任意依存）
+except ImportError:
+    Parallel = None
+
+# 文字列列の型（pyarrowがあればArrowの文字列カーネルを使用）
+try:
+    import pyarrow  # noqa: F401（任意依存）
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _STRING_DTYPE = 'string'
+
+# 金額・注記番号の抽出パターン
+_AMOUNT_RE = re.compile(r'[△-]?[\d,]+')
+_NOTE_RE = re.compile(r'※[0-9,\s]*')
+
+# 数値のみの金額を正規表現なしで処理するための変換表（△記号をマイナス記号に変換）
+_AMOUNT_CHARS = '0123456789,-'
+_AMOUNT_TRANS = str.maketrans('△', '-')
+
+# 抽出した金額を数値変換できる形にする変換表（△記号をマイナス記号に変換し、カンマを除去）
+_AMOUNT_NUMERIC_TRANS = str.maketrans({'△': '-', ',': None})
+
+# int64で確実に表現できる最大桁数（これを超える金額はPythonの整数で計算）
+_INT64_SAFE_DIGITS = 18
+
+
+def _to_million_unit(amount: int) -> int:
+    """百万円単位に変換（割り切れる場合のみ）"""
+    if abs(amount) >= 1000000 and amount % 1000000 == 0:
+        return amount // 1000000
+    return amount
+
+
+def _parse_amount_column(values: pd.Series) -> pd.Series:
+    """
+    値列から金額を抽出して整数に変換（百万円単位変換）
+
+    並列処理のワーカープロセスに渡せるようモジュールレベルで定義
+
+    Args:
+        values: 値列
+
+    Returns:
+        pd.Series: 金額（Int64、数値でない場合はNA）。int64に収まらない桁数の金額を含む場合は
+            Pythonの整数を格納したobject型（数値でない場合はNone）
+    """
+    # 全角数字・全角カンマ・全角マイナス等を半角に正規化した上で、正規表現1回 + 変換表1回で数値文字列に変換
+    # （1件ずつ処理する clean_amount_value と同じ扱い）
+    amount_strings = (
+        values.astype(_STRING_DTYPE)
+        .str.normalize('NFKC')
+        .str.extract(f'({_AMOUNT_RE.pattern})', expand=False)
+        .str.translate(_AMOUNT_NUMERIC_TRANS)
+    )
+    
+    # int64に収まらない可能性がある桁数の金額があれば、桁あふれしないようPythonの整数で変換
+    digit_counts = amount_strings.str.len() - amount_strings.str.startswith('-').astype('Int64')
+    if (digit_counts > _INT64_SAFE_DIGITS).any():
+        parsed = [
+            _to_million_unit(int(amount)) if isinstance(amount, str) and amount.lstrip('-') else None
+            for amount in amount_strings.tolist()
+        ]
+        return pd.Series(parsed, index=values.index, dtype=object)
+    
+    amounts = pd.to_numeric(amount_strings, errors='coerce', dtype_backend='numpy_nullable')
+
+    # 百万円単位に変換（割り切れる場合のみ）
+    in_millions = ((amounts.abs() >= 1000000) & (amounts % 1000000 == 0)).fillna(False)
+    return amounts.mask(in_millions, amounts // 1000000)
+
+
+@dataclass(frozen=True)
 class BSItem:
     """貸借対照表項目クラス"""
     level: int  # 階層レベル (0:大分類, 1:中分類, 2:小分類)
     name: str   # 項目名
     value: str  # 金額（文字列、カンマ区切り）
     note: str   # 注記番号
+    amount_int: Optional[int] = None  # 金額（整数、金額なしの場合はNone）
 
 class BalanceSheetTransformer:
     """貸借対照表形式への変換クラス"""
     
+    # 項目名列の候補（優先順位順）と列名パターン
+    _ITEM_CANDIDATES = ('項目名', '科目名', '勘定科目', 'Element', 'ElementName')
+    _ITEM_PATTERNS = ('項目', '科目', '勘定', 'Element')
+    
+    # 値列の候補（優先順位順）と列名パターン
+    _VALUE_CANDIDATES = ('値', '金額', 'Value', 'Amount', '残高')
+    _VALUE_PATTERNS = ('値', '金額', 'Value', 'Amount')
+    
+    # 金額抽出を並列処理する最小行数
+    # 並列化するのはベクトル化済みの正規表現抽出のみで、1回あたり100万行で約2秒程度のため、
+    # これ未満ではプロセス起動・データ転送のコストの方が大きい
+    _PARALLEL_MIN_ROWS = 1000000
+    
+    # 大分類項目
+    _MAJOR_CATEGORIES = frozenset(['資産の部', '負債の部', '純資産の部', '流動資産', '固定資産', '流動負債', '固定負債'])
+    
     def __init__(self, config: Dict[str, Any]):
         """
         初期化
@@ -29,6 +128,34 @@ class BalanceSheetTransformer:
         # 貸借対照表の構造定義
         self.bs_structure = self._load_bs_structure()
         
+        # 種別タグ付きの木に正規化した構造
+        self._structure_tree = self._normalize_structure(None, self.bs_structure, depth=0)
+        
+        # 出力順に平坦化した構造（行ごとの (種別, 階層レベル, 名称)）
+        self._flatten_handlers = {
+            'dict': self._flatten_dict_node,
+            'list': self._flatten_list_node,
+            'leaf': self._flatten_leaf_node
+        }
+        self._flat_structure = list(self._flatten_structure(self._structure_tree))
+        
+        # 科目マッピングのパターン一覧（優先順位順）
+        self._account_patterns = self._build_account_patterns()
+        self._account_automaton = self._build_account_automaton()
+        
+        # 同じ (項目名, 金額) の組み合わせはマッピング結果を再利用
+        self._map_item_cached = functools.lru_cache(maxsize=4096)(self._map_item_uncached)
+        
+        # 設定ファイルに定義された科目名の階層レベルを事前計算
+        self._level_cache: Dict[str, int] = {}
+        account_names = list(self.bs_config.get('account_mapping', {}).keys())
+        account_names.extend(name for _, _, name in self._flat_structure if name)
+        for account_name in account_names:
+            self._level_cache[account_name] = self._compute_account_level(account_name)
+        
+        # 列名のみから求めた値列の検出結果（列名の並びごと）
+        self._col_cache: Dict[Tuple, Optional[str]] = {}
+        
     def _load_bs_structure(self) -> Dict[str, Any]:
         """貸借対照表の構造を読み込む"""
         return self.bs_config.get('structure', {
@@ -114,6 +241,126 @@ class BalanceSheetTransformer:
             }
         })
     
+    def _normalize_structure(self, name: Optional[str], node: Any, depth: int) -> Dict[str, Any]:
+        """
+        貸借対照表の構造定義を種別タグ付きの木に正規化
+        
+        Args:
+            name: ノード名（ルートはNone）
+            node: 構造定義のノード
+            depth: 階層の深さ（ルートが0、セクションが1）
+            
+        Returns:
+            Dict[str, Any]: {'kind': 'dict'|'list'|'leaf', 'name': 名称, 'children': 子ノードのリスト}
+        """
+        # 辞書は小分類より上（深さ3未満）のみ展開し、それ以外は項目として扱う
+        if isinstance(node, dict) and depth < 3:
+            children = [self._normalize_structure(key, value, depth + 1) for key, value in node.items()]
+            return {'kind': 'dict', 'name': name, 'children': children}
+        
+        if isinstance(node, list):
+            children = [{'kind': 'leaf', 'name': item, 'children': []} for item in node]
+            return {'kind': 'list', 'name': name, 'children': children}
+        
+        return {'kind': 'leaf', 'name': name, 'children': []}
+    
+    def _flatten_structure(self, structure_tree: Dict[str, Any]) -> Iterator[Tuple[str, int, str]]:
+        """
+        貸借対照表の構造を出力行の順に平坦化
+        
+        Args:
+            structure_tree: 正規化済みの構造木
+            
+        Yields:
+            Tuple[str, int, str]: (種別, 階層レベル, 名称)
+                種別は 'header'（見出し行）、'item'（金額行）、'blank'（空行）
+        """
+        sections = {child['name']: child for child in structure_tree['children']}
+        
+        for index, section_name in enumerate(['資産の部', '負債の部']):
+            # セクション間に空行を追加
+            if index > 0:
+                yield ('blank', 0, '')
+            
+            section = sections.get(section_name, {'kind': 'dict', 'name': section_name, 'children': []})
+            yield from self._flatten_handlers[section['kind']](section, 1)
+    
+    def _flatten_dict_node(self, node: Dict[str, Any], depth: int) -> Iterator[Tuple[str, int, str]]:
+        """見出し行の後に子ノードを1階層下で展開（セクション、中分類）"""
+        yield ('header', depth, node['name'])
+        for child in node['children']:
+            yield from self._flatten_handlers[child['kind']](child, depth + 1)
+    
+    def _flatten_list_node(self, node: Dict[str, Any], depth: int) -> Iterator[Tuple[str, int, str]]:
+        """見出し行の後に項目を小分類の位置（第3列目）まで下げて展開"""
+        yield ('header', depth, node['name'])
+        for child in node['children']:
+            yield ('item', min(depth + 1, 3), child['name'])
+    
+    def _flatten_leaf_node(self, node: Dict[str, Any], depth: int) -> Iterator[Tuple[str, int, str]]:
+        """合計項目などの単独項目を1階層上の位置に展開"""
+        yield ('item', depth - 1, node['name'])
+    
+    def _build_account_patterns(self) -> List[Tuple[str, str]]:
+        """
+        設定ファイルの科目マッピングを (パターン, 貸借対照表科目) の一覧に展開
+        
+        Returns:
+            List[Tuple[str, str]]: 優先順位順のパターン一覧
+        """
+        patterns = []
+        mapping = self.bs_config.get('account_mapping', {})
+        
+        # 空のパターンは全ての項目名に含まれてしまうため対象外（オートマトン・フォールバックで共通）
+        for bs_account, source_patterns in mapping.items():
+            if isinstance(source_patterns, list):
+                for pattern in source_patterns:
+                    if isinstance(pattern, str) and pattern:
+                        patterns.append((pattern, bs_account))
+            elif isinstance(source_patterns, str) and source_patterns:
+                patterns.append((source_patterns, bs_account))
+        
+        return patterns
+    
+    def _build_account_automaton(self):
+        """
+        科目マッピングのパターンからAho-Corasickオートマトンを構築
+        
+        Returns:
+            ahocorasick.Automaton: 構築済みオートマトン（pyahocorasick未導入またはパターンなしの場合はNone）
+        """
+        if ahocorasick is None or not self._account_patterns:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for priority, (pattern, bs_account) in enumerate(self._account_patterns):
+            # 同じパターンが複数ある場合は優先順位の高い方を残す
+            if not automaton.exists(pattern):
+                automaton.add_word(pattern, (priority, bs_account))
+        automaton.make_automaton()
+        
+        return automaton
+    
+    def _match_bs_account(self, item_name_str: str) -> Optional[str]:
+        """
+        項目名に部分一致する貸借対照表科目を検索
+        
+        Args:
+            item_name_str: 項目名（前後の空白除去済み）
+            
+        Returns:
+            Optional[str]: 優先順位が最も高いパターンの貸借対照表科目
+        """
+        if self._account_automaton is not None:
+            best = min((payload for _, payload in self._account_automaton.iter(item_name_str)), default=None)
+            return best[1] if best else None
+        
+        for pattern, bs_account in self._account_patterns:
+            if pattern in item_name_str:
+                return bs_account
+        
+        return None
+    
     def clean_amount_value(self, value: str) -> str:
         """
         金額値のクリーニング（※記号除去と数値抽出）
@@ -127,15 +374,21 @@ class BalanceSheetTransformer:
         if pd.isna(value) or value == "":
             return ""
         
-        str_value = str(value)
+        # 全角数字・全角カンマ・全角マイナス等を半角に正規化（一括処理の _parse_amount_column と同じ扱い）
+        str_value = unicodedata.normalize('NFKC', str(value))
+        
+        # 数字・カンマ・符号のみで構成された値は正規表現を使わずに変換
+        cleaned = str_value.strip().translate(_AMOUNT_TRANS)
+        if cleaned and cleaned != '-' and not cleaned.strip(_AMOUNT_CHARS) and '-' not in cleaned[1:]:
+            return cleaned
         
         # 数値パターンを検索（負の値も対応）
         # パターン: 数字、カンマ、マイナス記号を含む数値
-        number_patterns = re.findall(r'[△-]?[\d,]+', str_value)
+        # 最初に見つかった数値パターンのみ使用するため search で打ち切る
+        number_match = _AMOUNT_RE.search(str_value)
         
-        if number_patterns:
-            # 最初に見つかった数値パターンを使用
-            cleaned = number_patterns[0]
+        if number_match:
+            cleaned = number_match.group()
             
             # △記号をマイナス記号に変換
             if cleaned.startswith('△'):
@@ -158,35 +411,34 @@ class BalanceSheetTransformer:
         if not amount or amount == "":
             return ""
         
-        try:
-            # カンマを除去して数値に変換
-            clean_amount = amount.replace(',', '')
-            
-            # マイナス記号の処理
-            is_negative = clean_amount.startswith('-')
-            if is_negative:
-                clean_amount = clean_amount[1:]
-            
-            # 数値変換
-            num_value = float(clean_amount)
-            
-            # 百万円単位に変換（割り切れる場合のみ）
-            if num_value >= 1000000 and num_value % 1000000 == 0:
-                num_value = int(num_value / 1000000)
-                if is_negative:
-                    return f"{num_value * -1:,}"
-                else:
-                    return f"{num_value:,}"
-            else:
-                # 元の値をそのままカンマ区切りで返す
-                if is_negative:
-                    return f"-{int(num_value):,}"
-                else:
-                    return f"{int(num_value):,}"
-                
-        except (ValueError, TypeError):
+        num_value = self._parse_amount(amount)
+        if num_value is None:
             # 数値でない場合はそのまま返す
             return str(amount)
+        
+        return f"{num_value:,}"
+    
+    def _parse_amount(self, amount: str) -> Optional[int]:
+        """
+        金額を整数に変換（百万円単位変換）
+        
+        Args:
+            amount: 金額文字列
+            
+        Returns:
+            Optional[int]: 変換後の金額（数値でない場合はNone）
+        """
+        try:
+            # カンマを除去して整数に変換（符号はintが処理）
+            num_value = int(amount.replace(',', ''))
+        except (ValueError, TypeError, AttributeError):
+            return None
+        
+        # 百万円単位に変換（割り切れる場合のみ）
+        if num_value and num_value % 1000000 == 0:
+            num_value //= 1000000
+        
+        return num_value
     
     def extract_note_numbers(self, value: str) -> str:
         """
@@ -202,7 +454,7 @@ class BalanceSheetTransformer:
             return ""
         
         # ※記号とその後の数字・カンマ・スペースを抽出
-        notes = re.findall(r'※[0-9,\s]*', str(value))
+        notes = _NOTE_RE.findall(str(value))
         if notes:
             return ''.join(notes).strip()
         
@@ -228,37 +480,108 @@ class BalanceSheetTransformer:
         if not item_name_str:
             return None
         
-        # 設定ファイルからマッピングを取得
-        mapping = self.bs_config.get('account_mapping', {})
+        if pd.isna(amount):
+            amount = ""
+        
+        return self._map_item_cached(item_name_str, amount)
+    
+    def _map_item_uncached(self, item_name_str: str, amount: str) -> Optional[BSItem]:
+        """
+        項目名を貸借対照表科目にマッピング（キャッシュなしの本体）
         
+        Args:
+            item_name_str: 項目名（前後の空白除去済み）
+            amount: 金額
+            
+        Returns:
+            Optional[BSItem]: マッピング結果
+        """
         # 金額のクリーニング
         note = self.extract_note_numbers(amount)
         clean_amount = self.clean_amount_value(amount)
         formatted_amount = self.format_amount(clean_amount)
+        amount_int = self._parse_amount(clean_amount) if clean_amount else None
         
-        # 完全一致検索
-        for bs_account, source_patterns in mapping.items():
-            if isinstance(source_patterns, list):
-                for pattern in source_patterns:
-                    if isinstance(pattern, str) and pattern in item_name_str:
-                        return BSItem(
-                            level=self._get_account_level(bs_account),
-                            name=bs_account,
-                            value=formatted_amount,
-                            note=note
-                        )
-            elif isinstance(source_patterns, str):
-                if source_patterns in item_name_str:
-                    return BSItem(
-                        level=self._get_account_level(bs_account),
-                        name=bs_account,
-                        value=formatted_amount,
-                        note=note
-                    )
+        # 部分一致検索
+        bs_account = self._match_bs_account(item_name_str)
+        if bs_account is None:
+            return None
         
-        return None
+        return BSItem(
+            level=self._get_account_level(bs_account),
+            name=bs_account,
+            value=formatted_amount,
+            note=note,
+            amount_int=amount_int
+        )
+    
+    def _map_items_to_bs_accounts(self, df: pd.DataFrame, item_name_col: str, value_col: str) -> pd.DataFrame:
+        """
+        項目名列と値列を列単位でまとめて貸借対照表科目にマッピング
+        
+        Args:
+            df: 入力データフレーム
+            item_name_col: 項目名列名
+            value_col: 値列名
+            
+        Returns:
+            pd.DataFrame: マッピングされた行の bs_account, amount 列
+        """
+        item_names = df[item_name_col].astype(_STRING_DTYPE).str.strip()
+        
+        # ユニークな項目名ごとに部分一致検索
+        unique_names = pd.Series(item_names[item_names.fillna('') != ''].unique(), dtype=_STRING_DTYPE)
+        if self._account_automaton is not None:
+            account_lookup = {name: self._match_bs_account(name) for name in unique_names}
+        else:
+            # 優先順位の高いパターンから順に列単位で検索
+            matched = pd.Series(pd.NA, index=unique_names.index, dtype='object')
+            for pattern, bs_account in self._account_patterns:
+                unmatched = matched.isna()
+                if not unmatched.any():
+                    break
+                hit = unmatched & unique_names.str.contains(pattern, regex=False, na=False)
+                matched[hit] = bs_account
+            account_lookup = dict(zip(unique_names, matched))
+        
+        accounts = item_names.map(account_lookup)
+        is_mapped = accounts.notna()
+        
+        # マッピングされた行のみ金額を抽出
+        # 注記番号は合算結果に出力しないため抽出しない
+        values = df.loc[is_mapped, value_col]
+        n_chunks = os.cpu_count() or 1
+        if Parallel is not None and n_chunks > 1 and len(values) > self._PARALLEL_MIN_ROWS:
+            # 大きな入力はCPU数で分割して並列処理
+            bounds = np.linspace(0, len(values), n_chunks + 1, dtype=int)
+            chunks = [values.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+            self.logger.info(f"金額抽出を並列実行: {n_chunks}分割")
+            amounts = pd.concat(Parallel(n_jobs=n_chunks)(delayed(_parse_amount_column)(chunk) for chunk in chunks))
+        else:
+            amounts = _parse_amount_column(values)
+        
+        return pd.DataFrame({
+            'bs_account': accounts[is_mapped],
+            'amount': amounts
+        })
     
     def _get_account_level(self, account_name: str) -> int:
+        """
+        科目名から階層レベルを取得（事前計算済みのキャッシュを優先）
+        
+        Args:
+            account_name: 科目名
+            
+        Returns:
+            int: 階層レベル
+        """
+        level = self._level_cache.get(account_name)
+        if level is None:
+            level = self._compute_account_level(account_name)
+            self._level_cache[account_name] = level
+        return level
+    
+    def _compute_account_level(self, account_name: str) -> int:
         """
         科目名から階層レベルを判定
         
@@ -273,8 +596,7 @@ class BalanceSheetTransformer:
             return 1
             
         # 大分類項目
-        major_categories = ['資産の部', '負債の部', '純資産の部', '流動資産', '固定資産', '流動負債', '固定負債']
-        if account_name in major_categories:
+        if account_name in self._MAJOR_CATEGORIES:
             return 0
             
         # その他は小分類
@@ -290,6 +612,58 @@ class BalanceSheetTransformer:
         Returns:
             pd.DataFrame: 貸借対照表形式のデータフレーム
         """
+        totals = self._consolidate_amounts(df)
+        if totals is None:
+            # 空の貸借対照表を返す
+            return self._convert_to_csv_format([])
+        
+        # 貸借対照表構造に基づいて整理
+        bs_array = self._build_balance_sheet_structure_with_grouping(totals)
+        
+        # データフレーム作成（ヘッダーなし）
+        result_df = pd.DataFrame(bs_array)
+        
+        self.logger.info(f"貸借対照表変換完了: {len(result_df)}行")
+        
+        return result_df
+    
+    def write_balance_sheet(self, df: pd.DataFrame, output_path: str) -> Tuple[int, int]:
+        """
+        縦持ちデータを貸借対照表形式に変換し、データフレームを経由せずにCSVへ直接書き出す
+        
+        Args:
+            df: 入力データフレーム
+            output_path: 出力ファイルパス
+            
+        Returns:
+            Tuple[int, int]: 出力した行数と列数
+        """
+        totals = self._consolidate_amounts(df)
+        if totals is None:
+            # 空の貸借対照表を出力
+            bs_array = np.empty((0, 25), dtype=object)
+        else:
+            bs_array = self._build_balance_sheet_structure_with_grouping(totals)
+        
+        # DataFrame.to_csv(index=False, header=False) と同じ形式で書き出す
+        with open(output_path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file, lineterminator=os.linesep)
+            writer.writerows(bs_array)
+        
+        self.logger.info(f"貸借対照表変換完了: {len(bs_array)}行")
+        
+        return bs_array.shape
+    
+    def _consolidate_amounts(self, df: pd.DataFrame) -> Optional[Dict[str, int]]:
+        """
+        当期末データを抽出して貸借対照表科目ごとに金額を合算
+        
+        Args:
+            df: 入力データフレーム
+            
+        Returns:
+            Optional[Dict[str, int]]: 科目名ごとの合算金額（項目名または値の列が見つからない場合はNone）
+        """
         self.logger.info("貸借対照表形式への変換を開始します")
         
         # データフレーム情報をログ出力
@@ -297,18 +671,20 @@ class BalanceSheetTransformer:
         self.logger.info(f"列名: {list(df.columns)}")
         
         # 当期末のデータのみを抽出（複数条件でフィルタリング）
-        current_year_df = df.copy()
+        current_year_df = df
         
         # 条件1: コンテキストIDがある場合
         if 'コンテキストID' in df.columns:
-            current_year_mask = df['コンテキストID'].str.contains('CurrentYear|Current', na=False, case=False)
-            current_year_df = df[current_year_mask].copy()
+            # 'CurrentYear|Current' は 'Current' の部分一致と同値のため固定文字列で検索
+            context_ids = df['コンテキストID'].astype(_STRING_DTYPE)
+            current_year_mask = context_ids.str.contains('Current', case=False, regex=False, na=False)
+            current_year_df = df[current_year_mask]
             self.logger.info(f"コンテキストID条件でフィルタ: {len(current_year_df)}件")
         
         # 条件2: 相対年度がある場合
         elif '相対年度' in df.columns:
-            current_year_mask = (df['相対年度'] == '当期') | (df['相対年度'] == '当期末')
-            current_year_df = df[current_year_mask].copy()
+            current_year_mask = df['相対年度'].astype(_STRING_DTYPE).isin(['当期', '当期末']).fillna(False)
+            current_year_df = df[current_year_mask]
             self.logger.info(f"相対年度条件でフィルタ: {len(current_year_df)}件")
             
         # 条件3: 時点情報がある場合（jpcrp形式）
@@ -317,13 +693,13 @@ class BalanceSheetTransformer:
             instant_cols = [col for col in df.columns if 'Instant' in col or 'Quarter' in col]
             if instant_cols:
                 # 当期四半期末または当期年度末のデータを抽出
-                mask = pd.Series([False] * len(df))
+                mask = pd.Series(False, index=df.index)
                 for col in instant_cols:
                     if 'Current' in str(df[col].iloc[0]) if len(df) > 0 else False:
-                        mask = mask | df[col].str.contains('Current', na=False, case=False)
+                        mask = mask | df[col].astype(_STRING_DTYPE).str.contains('Current', case=False, regex=False, na=False)
                 
                 if mask.any():
-                    current_year_df = df[mask].copy()
+                    current_year_df = df[mask]
                     self.logger.info(f"時点情報条件でフィルタ: {len(current_year_df)}件")
         
         # フィルタ結果をログ出力
@@ -338,168 +714,57 @@ class BalanceSheetTransformer:
         
         if not item_name_col or not value_col:
             self.logger.warning("項目名または値の列が見つかりません")
-            # 空の貸借対照表を返す
-            return self._convert_to_csv_format([])
-        
-        # 貸借対照表項目のマッピング（同じ科目名でグループ化）
-        bs_items_dict = {}
-        mapped_count = 0
-        
-        for _, row in current_year_df.iterrows():
-            item_name = row[item_name_col] if pd.notna(row[item_name_col]) else ""
-            value = str(row[value_col]) if pd.notna(row[value_col]) else ""
-            
-            bs_item = self.map_item_to_bs_account(item_name, value)
-            if bs_item:
-                # 同じ科目名でグループ化
-                key = bs_item.name
-                if key not in bs_items_dict:
-                    bs_items_dict[key] = []
-                bs_items_dict[key].append(bs_item)
-                mapped_count += 1
-        
-        self.logger.info(f"マッピング済み項目: {mapped_count}件")
-        self.logger.info(f"ユニーク科目数: {len(bs_items_dict)}件")
-        
-        # 貸借対照表構造に基づいて整理
-        bs_table = self._build_balance_sheet_structure_with_grouping(bs_items_dict)
+            return None
         
-        # CSV形式に変換
-        return self._convert_to_csv_format(bs_table)
+        # 貸借対照表項目のマッピング（列単位で一括処理）
+        mapped_df = self._map_items_to_bs_accounts(current_year_df, item_name_col, value_col)
+        
+        self.logger.info(f"マッピング済み項目: {len(mapped_df)}件")
+        self.logger.info(f"ユニーク科目数: {mapped_df['bs_account'].nunique()}件")
+        
+        # 同じ科目の値を合算（有効な金額がない科目は除外）
+        # 金額は数値のまま保持し、文字列へのフォーマットは出力時に一度だけ行う
+        valid_df = mapped_df[mapped_df['amount'].notna()]
+        amounts = valid_df['amount']
+        if amounts.dtype != object:
+            # 合計がint64の範囲を超える場合はPythonの整数で合算する
+            abs_totals = amounts.astype('float64').abs().groupby(valid_df['bs_account'], sort=False).sum()
+            if abs_totals.empty or abs_totals.max() < 2 ** 62:
+                return amounts.groupby(valid_df['bs_account'], sort=False).sum().astype('int64').to_dict()
+            amounts = amounts.astype(object)
+        
+        totals = {}
+        for bs_account, amount in zip(valid_df['bs_account'], amounts):
+            totals[bs_account] = totals.get(bs_account, 0) + int(amount)
+        return totals
     
-    def _build_balance_sheet_structure_with_grouping(self, bs_items_dict: Dict[str, List[BSItem]]) -> List[List[str]]:
+    def _build_balance_sheet_structure_with_grouping(self, totals: Dict[str, int]) -> np.ndarray:
         """
         貸借対照表の構造を構築（グループ化されたアイテム用）
         
         Args:
-            bs_items_dict: 科目名でグループ化されたBSアイテム辞書
+            totals: 科目名ごとの合算金額
             
         Returns:
-            List[List[str]]: 貸借対照表の行データ
-        """
-        # 合算処理を行ったアイテム辞書を作成
-        consolidated_items = {}
-        
-        for account_name, items_list in bs_items_dict.items():
-            if items_list:
-                # 同じ科目の値を合算
-                total_amount = 0
-                has_valid_amount = False
-                
-                for item in items_list:
-                    if item.value and item.value.strip():
-                        try:
-                            clean_value = item.value.replace(',', '')
-                            if clean_value.startswith('-'):
-                                amount = -float(clean_value[1:])
-                            else:
-                                amount = float(clean_value)
-                            total_amount += amount
-                            has_valid_amount = True
-                        except (ValueError, TypeError):
-                            continue
-                
-                if has_valid_amount:
-                    # 合算した値で新しいBSItemを作成
-                    formatted_amount = f"{int(total_amount):,}" if total_amount == int(total_amount) else f"{total_amount:,.0f}"
-                    consolidated_items[account_name] = BSItem(
-                        level=items_list[0].level,
-                        name=account_name,
-                        value=formatted_amount,
-                        note=""  # 注記は出力しない
-                    )
-        
-        bs_rows = []
-        
-        # 資産の部を構築
-        bs_rows.extend(self._build_section_with_grouping('資産の部', consolidated_items))
-        
-        # 空行を追加
-        bs_rows.append([''] * 25)
-        
-        # 負債の部を構築
-        bs_rows.extend(self._build_section_with_grouping('負債の部', consolidated_items))
-        
-        return bs_rows
-    
-    def _build_section_with_grouping(self, section_name: str, item_dict: Dict[str, BSItem]) -> List[List[str]]:
+            np.ndarray: 貸借対照表の行データ（行数 x 25列）
         """
-        セクション（資産の部、負債の部）を構築（グループ化対応）
+        # 全行を25列の空文字で確保
+        bs_array = np.full((len(self._flat_structure), 25), '', dtype=object)
         
-        Args:
-            section_name: セクション名
-            item_dict: 項目辞書
+        for row_index, (kind, level, name) in enumerate(self._flat_structure):
+            if kind == 'blank':
+                continue
             
-        Returns:
-            List[List[str]]: セクションの行データ
-        """
-        rows = []
-        structure = self.bs_structure.get(section_name, {})
-        
-        # セクションヘッダー
-        rows.append([section_name] + [''] * 24)
-        
-        for category, subcategories in structure.items():
-            if isinstance(subcategories, dict):
-                # 中分類ヘッダー
-                rows.append(['', category] + [''] * 23)
-                
-                for subcat, items in subcategories.items():
-                    if isinstance(items, list):
-                        # 小分類ヘッダー
-                        rows.append(['', '', subcat] + [''] * 22)
-                        
-                        # 項目追加
-                        for item_name in items:
-                            rows.extend(self._add_item_row_with_grouping(item_name, item_dict, level=3))
-                    else:
-                        # 項目追加
-                        rows.extend(self._add_item_row_with_grouping(subcat, item_dict, level=2))
-                        
-            elif isinstance(subcategories, list):
-                # 中分類ヘッダー
-                rows.append(['', category] + [''] * 23)
-                
-                # 項目追加
-                for item_name in subcategories:
-                    rows.extend(self._add_item_row_with_grouping(item_name, item_dict, level=3))
-                    
-            else:
-                # 合計項目
-                rows.extend(self._add_item_row_with_grouping(category, item_dict, level=1))
-        
-        return rows
-    
-    def _add_item_row_with_grouping(self, item_name: str, item_dict: Dict[str, BSItem], level: int) -> List[List[str]]:
-        """
-        項目行を追加（グループ化対応）
-        
-        Args:
-            item_name: 項目名
-            item_dict: 項目辞書
-            level: 階層レベル
+            # 階層に応じて配置（イオンBS_original.csvと同じ構造）
+            bs_array[row_index, level - 1] = name
             
-        Returns:
-            List[List[str]]: 項目行データ
-        """
-        item = item_dict.get(item_name)
-        
-        # 空の行を作成（25列）
-        row = [''] * 25
+            # 金額を表示（第9列目）
+            if kind == 'item':
+                total_amount = totals.get(name)
+                if total_amount is not None:
+                    bs_array[row_index, 9] = f'"{total_amount:,}"'
         
-        # 階層に応じて配置（イオンBS_original.csvと同じ構造）
-        if level == 1:  # 大分類
-            row[0] = item_name
-        elif level == 2:  # 中分類
-            row[1] = item_name
-        elif level == 3:  # 小分類（第3列目に配置）
-            row[2] = item_name
-        
-        # 金額を表示（第9列目）
-        if item and item.value:
-            row[9] = f'"{item.value}"'
-        
-        return [row]
+        return bs_array
 
     def _build_balance_sheet_structure(self, bs_items: List[BSItem]) -> List[List[str]]:
         """
@@ -603,28 +868,20 @@ class BalanceSheetTransformer:
         
         # 金額の合算と表示（第9列目）
         if matching_items:
+            # 整数の金額をそのまま合算（文字列の再変換はしない）
             total_amount = 0
             has_valid_amount = False
             
             for item in matching_items:
-                if item.value and item.value.strip():
-                    try:
-                        # カンマを除去して数値変換
-                        clean_value = item.value.replace(',', '')
-                        if clean_value.startswith('-'):
-                            amount = -float(clean_value[1:])
-                        else:
-                            amount = float(clean_value)
-                        total_amount += amount
-                        has_valid_amount = True
-                    except (ValueError, TypeError):
-                        continue
+                if item.amount_int is not None:
+                    total_amount += item.amount_int
+                    has_valid_amount = True
             
             if has_valid_amount:
                 # 金額をフォーマット
-                formatted_amount = f"{int(total_amount):,}" if total_amount.is_integer() else f"{total_amount:,.0f}"
+                formatted_amount = f"{total_amount:,}"
                 if total_amount < 0:
-                    formatted_amount = f"△{abs(int(total_amount)):,}"
+                    formatted_amount = f"△{abs(total_amount):,}"
                 
                 row[9] = f'"{formatted_amount}"'
         
@@ -641,15 +898,14 @@ class BalanceSheetTransformer:
             Optional[str]: 項目名列名
         """
         # 優先順位順に検索
-        candidates = ['項目名', '科目名', '勘定科目', 'Element', 'ElementName']
-        
-        for candidate in candidates:
-            if candidate in df.columns:
+        columns = set(df.columns)
+        for candidate in self._ITEM_CANDIDATES:
+            if candidate in columns:
                 return candidate
         
         # パターンマッチング
         for col in df.columns:
-            if any(pattern in col for pattern in ['項目', '科目', '勘定', 'Element']):
+            if any(pattern in col for pattern in self._ITEM_PATTERNS):
                 return col
         
         # 最初の文字列型列を使用
@@ -669,36 +925,65 @@ class BalanceSheetTransformer:
         Returns:
             Optional[str]: 値列名
         """
-        # 優先順位順に検索
-        candidates = ['値', '金額', 'Value', 'Amount', '残高']
+        # 列名のみによる検出結果は同じ列名の並びで再利用
+        columns = tuple(df.columns)
+        if columns not in self._col_cache:
+            self._col_cache[columns] = self._find_value_column_by_name(columns)
+        
+        value_col = self._col_cache[columns]
+        if value_col is not None:
+            return value_col
         
-        for candidate in candidates:
-            if candidate in df.columns:
+        # 列名で見つからない場合はデータの内容から推定（データごとに結果が異なるためキャッシュしない）
+        return self._find_value_column_by_content(df)
+    
+    def _find_value_column_by_name(self, columns: Tuple) -> Optional[str]:
+        """
+        列名から値列を検索
+        
+        Args:
+            columns: 列名の並び
+            
+        Returns:
+            Optional[str]: 値列名
+        """
+        # 優先順位順に検索
+        column_set = set(columns)
+        for candidate in self._VALUE_CANDIDATES:
+            if candidate in column_set:
                 return candidate
         
         # パターンマッチング
-        for col in df.columns:
-            if any(pattern in col for pattern in ['値', '金額', 'Value', 'Amount']):
+        for col in columns:
+            if any(pattern in col for pattern in self._VALUE_PATTERNS):
                 return col
         
+        return None
+    
+    def _find_value_column_by_content(self, df: pd.DataFrame) -> Optional[str]:
+        """
+        列の型・先頭の値から値列を検索
+        
+        Args:
+            df: データフレーム
+            
+        Returns:
+            Optional[str]: 値列名
+        """
         # 数値っぽい列を検索
         for col in df.columns:
             if df[col].dtype in ['int64', 'float64']:
                 return col
             # 文字列だが数値が含まれている列
             elif df[col].dtype == 'object':
-                # サンプルの値をチェック
-                sample_values = df[col].dropna().head(10)
-                numeric_count = 0
-                for val in sample_values:
-                    val_str = str(val).replace(',', '').replace('△', '-').strip()
-                    try:
-                        float(val_str)
-                        numeric_count += 1
-                    except:
-                        pass
+                # サンプルの値をまとめて数値変換してチェック
+                sample_values = df[col].dropna().head(10).astype(str)
+                numeric_values = pd.to_numeric(
+                    sample_values.str.replace(',', '', regex=False).str.replace('△', '-', regex=False).str.strip(),
+                    errors='coerce'
+                )
                 
-                if numeric_count > len(sample_values) * 0.5:  # 半分以上が数値
+                if numeric_values.notna().mean() > 0.5:  # 半分以上が数値
                     return col
         
         return None
@@ -16,12 +16,13 @@ from processor import CSVProcessor
 from bs_transformer import BalanceSheetTransformer
 
 
-def generate_output_filename(base_name: str = None) -> str:
+def generate_output_filename(base_name: str = None, extension: str = ".csv") -> str:
     """
     出力ファイル名を生成（MMDDHHMM.csv形式）
 
     Args:
         base_name: ベースとなるファイル名（指定されない場合は現在日時を使用）
+        extension: 自動生成する場合の拡張子
 
     Returns:
         str: 生成されたファイル名
@@ -31,7 +32,7 @@ def generate_output_filename(base_name: str = None) -> str:
 
     now = datetime.now()
     timestamp = now.strftime("%m%d%H%M")
-    return f"{timestamp}.csv"
+    return f"{timestamp}{extension}"
 
 
 def validate_file_paths(input_path: str, config_path: str, output_path: str):
@@ -109,6 +110,19 @@ def setup_argument_parser() -> argparse.ArgumentParser:
         help="出力形式（standard: 通常の科目マッピング、bs: 貸借対照表形式）"
     )
 
+    parser.add_argument(
+        "--backend",
+        choices=["pandas", "polars"],
+        default="pandas",
+        help="standard形式の処理バックエンド（polarsを使用する場合はpolarsのインストールが必要）"
+    )
+
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        help="standard形式で入力を指定行数ずつ分割して処理する（大きなファイル向け、pandasバックエンドのみ）"
+    )
+
     return parser
 
 
@@ -130,6 +144,15 @@ def main():
     parser = setup_argument_parser()
     args = parser.parse_args()
 
+    # 組み合わせられないオプションの確認
+    if args.chunk_rows is not None:
+        if args.chunk_rows < 1:
+            parser.error("--chunk-rows には1以上の行数を指定してください")
+        if args.backend == "polars":
+            parser.error("--chunk-rows は --backend polars と併用できません")
+        if args.format == "bs":
+            parser.error("--chunk-rows は --format bs と併用できません")
+
     # ログ設定
     setup_logging(args.verbose)
     logger = logging.getLogger(__name__)
@@ -140,8 +163,9 @@ def main():
             # 貸借対照表形式の場合もMMDDHHmm.csv形式
             output_path = args.output or generate_output_filename()
         else:
-            # 通常形式の場合は既存ロジック
-            output_path = args.output or generate_output_filename()
+            # 通常形式の場合は設定の出力形式（output.format）に応じた拡張子
+            processor = CSVProcessor(args.config)
+            output_path = args.output or generate_output_filename(extension=processor.output_extension)
 
         logger.info("=== CSV処理開始 ===")
         logger.info(f"入力ファイル: {args.input}")
@@ -172,18 +196,15 @@ def main():
             else:
                 # 実際の処理実行
                 df = processor.load_csv(args.input)
-                result_df = bs_transformer.transform_to_balance_sheet(df)
 
-                # CSVファイルに保存
-                result_df.to_csv(output_path, index=False, header=False, encoding='utf-8')
+                # 変換結果をCSVファイルに直接書き出し
+                n_rows, n_cols = bs_transformer.write_balance_sheet(df, output_path)
 
                 logger.info("=== 処理完了 ===")
-                logger.info(f"処理結果: {result_df.shape[0]}行 x {result_df.shape[1]}列")
+                logger.info(f"処理結果: {n_rows}行 x {n_cols}列")
                 logger.info(f"出力ファイル: {output_path}")
         else:
             # 通常の科目マッピングモード
-            processor = CSVProcessor(args.config)
-
             if args.dry_run:
                 # ドライランモード: 設定内容の確認のみ
                 logger.info("設定ファイルが正常に読み込まれました")
@@ -196,10 +217,13 @@ def main():
 
             else:
                 # 実際の処理実行
-                result_df = processor.process(args.input, output_path)
+                if args.chunk_rows is not None:
+                    n_rows, n_cols = processor.process_streaming(args.input, output_path, chunk_rows=args.chunk_rows)
+                else:
+                    n_rows, n_cols = processor.process(args.input, output_path, backend=args.backend).shape
 
                 logger.info("=== 処理完了 ===")
-                logger.info(f"処理結果: {result_df.shape[0]}行 x {result_df.shape[1]}列")
+                logger.info(f"処理結果: {n_rows}行 x {n_cols}列")
                 logger.info(f"出力ファイル: {output_path}")
 
     except FileNotFoundError as e:
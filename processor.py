@@ -1,11 +1,34 @@
 import pandas as pd
+import numpy as np
 import json
+import gzip
 import re
 import logging
-from typing import Dict, List, Any, Optional
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+try:
+    import ahocorasick  # pyahocorasick（任意依存）
+except ImportError:
+    ahocorasick = None
+
+try:
+    import polars as pl  # polars（任意依存）
+except ImportError:
+    pl = None
+
+
 class CSVProcessor:
+    # 出力形式ごとのファイル拡張子
+    OUTPUT_EXTENSIONS = {
+        'csv': '.csv',
+        'csv.gz': '.csv.gz',
+        'parquet': '.parquet'
+    }
+
     def __init__(self, config_path: str):
         """
         CSVプロセッサーの初期化
@@ -15,6 +38,9 @@ class CSVProcessor:
         """
         self.config = self._load_config(config_path)
         self.account_mapping = self._flatten_account_mapping()
+        self._partial_automaton = self._build_partial_automaton()
+        self._partial_trie = self._build_partial_trie() if self._partial_automaton is None else None
+        self._setup_column_patterns()
         self._setup_logging()
 
     def _load_config(self, config_path: str) -> Dict[str, Any]:
@@ -32,12 +58,75 @@ class CSVProcessor:
         flattened = {}
         account_mapping = self.config.get('account_mapping', {})
 
+        # 検索側は空白除去済みの値を使用するため、キーも一度だけ正規化しておく
         for category, mappings in account_mapping.items():
             for sl_account, general_account in mappings.items():
-                flattened[sl_account] = general_account
+                flattened[str(sl_account).strip()] = str(general_account)
 
         return flattened
 
+    def _build_partial_automaton(self):
+        """部分一致検索用のAho-Corasickオートマトンを構築（pyahocorasick未導入・検索語がない場合はNone）"""
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for priority, (sl_account, general_account) in enumerate(self.account_mapping.items()):
+            # 空のキーは全ての値に含まれてしまうため部分一致の対象外
+            if sl_account:
+                automaton.add_word(sl_account, (priority, general_account))
+
+        # 単語のないオートマトンは make_automaton() 後も検索できないため使用しない
+        if len(automaton) == 0:
+            return None
+        automaton.make_automaton()
+
+        return automaton
+
+    def _build_partial_trie(self) -> Dict[Any, Any]:
+        """部分一致検索用のトライ木を構築（pyahocorasick未導入時のフォールバック）"""
+        trie = {}
+        for priority, (sl_account, general_account) in enumerate(self.account_mapping.items()):
+            # 空のキーは全ての値に含まれてしまうため部分一致の対象外（オートマトンと同じ扱い）
+            if not sl_account:
+                continue
+            node = trie
+            for char in sl_account:
+                node = node.setdefault(char, {})
+            # 終端ノードには None をキーとして（優先順位, 一般科目）を格納
+            node[None] = (priority, general_account)
+
+        return trie
+
+    def _setup_column_patterns(self):
+        """処理対象列・除外列のパターンをそれぞれ1つの正規表現にまとめてコンパイル"""
+        processing_config = self.config.get('processing_columns', {})
+        self._target_patterns = self._compile_column_patterns(processing_config.get('target_columns', []))
+        self._exclude_patterns = self._compile_column_patterns(processing_config.get('exclude_columns', []))
+        self._has_patterns = self._target_patterns is not None or self._exclude_patterns is not None
+
+        # 列名ごとの判定結果と列構成ごとの対象列をキャッシュ（パターン再設定時に作り直す）
+        self._is_target_column_cached = functools.lru_cache(maxsize=None)(self._compute_is_target_column)
+        self._target_columns_cache = {}
+
+    def _compile_column_patterns(self, patterns: List[str]) -> Optional[Tuple[re.Pattern, ...]]:
+        """
+        列名パターンを個別にコンパイル（パターンがない場合はNone）
+
+        結合するとインラインフラグやグループ番号の意味が変わるため、パターンごとにコンパイルする。
+        判定結果は列名ごとにキャッシュされるため、照合回数はパターン数×列数に収まる。
+
+        Args:
+            patterns: 列名パターンの一覧
+
+        Returns:
+            Optional[Tuple[re.Pattern, ...]]: コンパイル済みパターン（いずれかにマッチすれば該当）
+        """
+        if not patterns:
+            return None
+
+        return tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+
     def _setup_logging(self):
         """ログ設定をセットアップ"""
         log_config = self.config.get('logging', {})
@@ -55,19 +144,15 @@ class CSVProcessor:
         Returns:
             DataFrame: 読み込んだデータ
         """
-        input_config = self.config.get('input', {})
+        read_options = self._csv_read_options()
 
         try:
-            df = pd.read_csv(
-                file_path,
-                encoding=input_config.get('file_encoding', 'utf-8'),
-                delimiter=input_config.get('delimiter', '\t'),
-                header=input_config.get('header_row', 1) - 1  # 0ベースのインデックス
-            )
+            df = pd.read_csv(file_path, **read_options)
 
-            self.logger.info(f"CSVファイルを読み込みました: {file_path}")
-            self.logger.info(f"データ形状: {df.shape}")
-            self.logger.info(f"列名: {list(df.columns)}")
+            self.logger.info("CSVファイルを読み込みました: %s", file_path)
+            self.logger.info("データ形状: %s", df.shape)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("列名: %s", list(df.columns))
 
             return df
 
@@ -76,48 +161,86 @@ class CSVProcessor:
         except Exception as e:
             raise ValueError(f"CSVファイルの読み込みエラー: {e}")
 
-    def _is_target_column(self, column_name: str) -> bool:
-        """処理対象の列かどうかを判定"""
-        processing_config = self.config.get('processing_columns', {})
-        target_patterns = processing_config.get('target_columns', [])
-        exclude_patterns = processing_config.get('exclude_columns', [])
-
-        # 除外パターンにマッチする場合は対象外
-        for pattern in exclude_patterns:
-            if re.search(pattern, column_name, re.IGNORECASE):
-                return False
+    def _csv_read_options(self) -> Dict[str, Any]:
+        """入力設定からpd.read_csvのオプションを作成"""
+        input_config = self.config.get('input', {})
+        return {
+            'encoding': input_config.get('file_encoding', 'utf-8'),
+            'delimiter': input_config.get('delimiter', '\t'),
+            'header': input_config.get('header_row', 1) - 1  # 0ベースのインデックス
+        }
 
-        # 対象パターンが指定されていない場合は全て対象
-        if not target_patterns:
+    def _is_target_column(self, column_name: str) -> bool:
+        """処理対象の列かどうかを判定（列名ごとにキャッシュ）"""
+        # 対象・除外パターンがどちらも未設定の場合は全ての列が対象
+        if not self._has_patterns:
             return True
+        return self._is_target_column_cached(column_name)
+
+    def _get_target_columns(self, columns) -> List[str]:
+        """列名の並びから処理対象列を取得（同じ列構成の場合はキャッシュを使用）"""
+        key = tuple(columns)
+        target_columns = self._target_columns_cache.get(key)
+        if target_columns is None:
+            target_columns = [col for col in key if self._is_target_column(col)]
+            self._target_columns_cache[key] = target_columns
+        return list(target_columns)
+
+    def _compute_is_target_column(self, column_name: str) -> bool:
+        """処理対象の列かどうかを正規表現で判定"""
+        # 除外パターンにマッチする場合は対象外
+        if self._exclude_patterns is not None and any(p.search(column_name) for p in self._exclude_patterns):
+            return False
 
-        # 対象パターンにマッチする場合は対象
-        for pattern in target_patterns:
-            if re.search(pattern, column_name, re.IGNORECASE):
-                return True
-
-        return False
+        # 対象パターンが指定されていない場合は全て対象、指定されている場合はマッチすれば対象
+        return self._target_patterns is None or any(p.search(column_name) for p in self._target_patterns)
 
     def _apply_account_mapping(self, value: Any) -> str:
         """単一の値に科目マッピングを適用"""
         if pd.isna(value) or value == "":
             return value
 
-        str_value = str(value).strip()
+        return self._map_stripped_value(str(value).strip())
 
+    def _map_stripped_value(self, str_value: str) -> str:
+        """空白除去済みの値に科目マッピングを適用"""
         # 完全一致での検索
-        if str_value in self.account_mapping:
-            return self.account_mapping[str_value]
+        general_account = self.account_mapping.get(str_value)
+        if general_account is not None:
+            return general_account
 
         # 部分一致での検索（SLデフォルト科目が含まれている場合）
-        for sl_account, general_account in self.account_mapping.items():
-            if sl_account in str_value:
-                self.logger.debug(f"部分一致でマッピング: '{str_value}' -> '{general_account}'")
-                return general_account
+        general_account = self._find_partial_match(str_value)
+        if general_account is not None:
+            return general_account
 
         # マッピングが見つからない場合は元の値を返す
         return str_value
 
+    def _find_partial_match(self, str_value: str) -> Optional[str]:
+        """部分一致で科目マッピングを検索（SLデフォルト科目が含まれている場合）"""
+        if self._partial_automaton is not None:
+            # 含まれているSLデフォルト科目のうち、マッピング定義で先に現れるものを採用
+            best = min((payload for _, payload in self._partial_automaton.iter(str_value)), default=None)
+            general_account = best[1] if best else None
+        else:
+            # 各開始位置からトライ木をたどり、含まれているSLデフォルト科目を全て列挙
+            best = None
+            for start in range(len(str_value)):
+                node = self._partial_trie
+                position = start
+                while node is not None:
+                    payload = node.get(None)
+                    if payload is not None and (best is None or payload < best):
+                        best = payload
+                    if position == len(str_value):
+                        break
+                    node = node.get(str_value[position])
+                    position += 1
+            general_account = best[1] if best else None
+
+        return general_account
+
     def transform_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         データに変換処理を適用
@@ -126,56 +249,170 @@ class CSVProcessor:
             df: 入力データ
 
         Returns:
-            DataFrame: 変換後のデータ
+            DataFrame: 変換後のデータ（対象外の列は入力データとバッファを共有）
+        """
+        transformed_df, mapping_stats = self._transform_with_stats(df)
+        mapping_stats['unmapped_items'] = sorted(mapping_stats['unmapped_items'].tolist())
+
+        # 統計情報をログ出力
+        self._log_mapping_stats(mapping_stats)
+
+        return transformed_df
+
+    def _transform_with_stats(self, df: pd.DataFrame):
+        """
+        データに変換処理を適用し、変換統計とあわせて返す
+
+        Args:
+            df: 入力データ
+
+        Returns:
+            tuple: (変換後のデータ, 変換統計（マッピングされなかった項目は pd.Index）)
         """
-        transformed_df = df.copy()
+        # 対象列のみ新しい列で置き換えるため、浅いコピーで十分（入力データ自体は変更しない）
+        transformed_df = df.copy(deep=False)
         mapping_stats = {
             'total_transformations': 0,
-            'mapped_items': [],
-            'unmapped_items': set()
+            'mapped_items': None,
+            'unmapped_items': pd.Index([], dtype=object)
         }
+        mapped_chunks = []
 
         # 処理対象列を特定
-        target_columns = [col for col in df.columns if self._is_target_column(col)]
-        self.logger.info(f"処理対象列: {target_columns}")
-
-        # 各列に科目マッピングを適用
-        for column in target_columns:
-            self.logger.info(f"列 '{column}' を処理中...")
-
-            original_values = transformed_df[column].copy()
-            transformed_df[column] = transformed_df[column].apply(self._apply_account_mapping)
-
-            # 変換統計を記録
-            for i, (original, transformed) in enumerate(zip(original_values, transformed_df[column])):
-                if original != transformed and not pd.isna(original):
-                    mapping_stats['total_transformations'] += 1
-                    mapping_stats['mapped_items'].append({
-                        'row': i + 1,
-                        'column': column,
-                        'original': original,
-                        'transformed': transformed
-                    })
-                elif not pd.isna(original) and str(original).strip() != "":
-                    # マッピングされなかった項目を記録
-                    mapping_stats['unmapped_items'].add(str(original).strip())
+        target_columns = self._get_target_columns(df.columns)
+        self.logger.info("処理対象列: %s", target_columns)
+
+        # 各列に科目マッピングを適用（設定により列単位でスレッド並列化）
+        parallel = self.config.get('processing_columns', {}).get('parallel_columns', False)
+        if parallel and len(target_columns) > 1:
+            max_workers = min(len(target_columns), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(
+                    lambda column: self._map_one_column(column, df[column]),
+                    target_columns
+                ))
+        else:
+            results = [self._map_one_column(column, df[column]) for column in target_columns]
+
+        # 変換結果をまとめて反映し、変換統計を記録
+        for column, new_values, mapped_chunk, unmapped in results:
+            transformed_df[column] = new_values
+            mapping_stats['total_transformations'] += len(mapped_chunk)
+            mapped_chunks.append(mapped_chunk)
+            mapping_stats['unmapped_items'] = mapping_stats['unmapped_items'].union(unmapped)
+
+        # 変換された項目を1つのデータフレームにまとめる（列: row, column, original, transformed）
+        mapping_stats['mapped_items'] = (
+            pd.concat(mapped_chunks, ignore_index=True) if mapped_chunks
+            else pd.DataFrame(columns=['row', 'column', 'original', 'transformed'])
+        )
+
+        return transformed_df, mapping_stats
+
+    def _map_one_column(self, column: str, original_values: pd.Series):
+        """
+        1列分の科目マッピングを適用
 
-        # 統計情報をログ出力
-        self._log_mapping_stats(mapping_stats)
+        Args:
+            column: 列名
+            original_values: 変換前の列データ
 
-        return transformed_df
+        Returns:
+            tuple: (列名, 変換後の列データ, 変換された項目のDataFrame, マッピングされなかった項目のIndex)
+        """
+        self.logger.info("列 '%s' を処理中...", column)
+
+        # インデックスに重複があっても処理できるよう、ラベルではなく位置で処理する
+        original_array = original_values.to_numpy(dtype=object)
+        not_na = original_values.notna().to_numpy()
+
+        # 欠損値以外を文字列化して前後の空白を除去
+        stripped = pd.Series(original_array[not_na]).astype(str).str.strip()
+
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        partial_matches = {}
+
+        categories = None
+        if self.config.get('processing_columns', {}).get('categorical_mapping', False):
+            # 値の種類が行数に比べて十分少ない列は、カテゴリごとに1回だけマッピングを判定
+            categorical = pd.Categorical(stripped)
+            if len(categorical.categories) < 0.1 * len(categorical):
+                categories = categorical
+
+        if categories is not None:
+            new_categories = np.array(
+                [value if value == "" else self._map_stripped_value(value) for value in categories.categories],
+                dtype=object
+            )
+            mapped = pd.Series(new_categories[categories.codes], index=stripped.index)
+
+            if debug_enabled:
+                partial_matches = {
+                    value: general for value, general in zip(categories.categories, new_categories)
+                    if value not in self.account_mapping and general != value
+                }
+        else:
+            # 完全一致での検索
+            mapped = stripped.map(self.account_mapping)
+
+            # 完全一致しなかった値はユニーク値ごとに部分一致で検索
+            missed = mapped.isna() & (stripped != "")
+            if missed.any():
+                partial_lookup = {value: self._find_partial_match(value) for value in stripped[missed].unique()}
+                mapped = mapped.fillna(stripped[missed].map(partial_lookup))
+
+                if debug_enabled:
+                    partial_matches = {value: general for value, general in partial_lookup.items() if general is not None}
+
+            # マッピングが見つからない場合は空白除去後の値を使用
+            mapped = mapped.fillna(stripped)
+
+        new_array = original_array.copy()
+        new_array[not_na] = mapped.to_numpy(dtype=object)
+        new_values = pd.Series(new_array, index=original_values.index, name=original_values.name)
+
+        # 部分一致の結果は列ごとにまとめてログ出力
+        if partial_matches:
+            self.logger.debug("列 '%s' の部分一致でのマッピング: %s", column, partial_matches)
+
+        # 変換された項目を記録
+        changed = not_na & (original_array != new_array)
+        mapped_chunk = pd.DataFrame({
+            'row': np.flatnonzero(changed) + 1,
+            'column': column,
+            'original': original_array[changed],
+            'transformed': new_array[changed]
+        })
+
+        # マッピングされなかった項目を記録
+        unmapped = pd.Index(stripped[~changed[not_na] & (stripped != "").to_numpy()].unique())
+
+        return column, new_values, mapped_chunk, unmapped
 
     def _log_mapping_stats(self, stats: Dict[str, Any]):
         """マッピング統計をログ出力"""
         log_config = self.config.get('logging', {})
 
         if log_config.get('show_mapping_stats', True):
-            self.logger.info(f"変換統計: {stats['total_transformations']}件の変換を実行")
-
-            if log_config.get('show_unmapped_items', True) and stats['unmapped_items']:
-                self.logger.warning(f"マッピングされなかった項目 ({len(stats['unmapped_items'])}件):")
-                for item in sorted(stats['unmapped_items']):
-                    self.logger.warning(f"  - {item}")
+            self.logger.info("変換統計: %d件の変換を実行", stats['total_transformations'])
+
+            if log_config.get('show_unmapped_items', True) and len(stats['unmapped_items']) > 0:
+                self.logger.warning("マッピングされなかった項目 (%d件):", len(stats['unmapped_items']))
+                for item in stats['unmapped_items']:
+                    self.logger.warning("  - %s", item)
+
+    @property
+    def output_format(self) -> str:
+        """出力形式（csv / csv.gz / parquet）を取得"""
+        output_format = self.config.get('output', {}).get('format', 'csv')
+        if output_format not in self.OUTPUT_EXTENSIONS:
+            raise ValueError(f"未対応の出力形式です: {output_format}")
+        return output_format
+
+    @property
+    def output_extension(self) -> str:
+        """出力形式に対応するファイル拡張子を取得"""
+        return self.OUTPUT_EXTENSIONS[self.output_format]
 
     def save_csv(self, df: pd.DataFrame, output_path: str):
         """
@@ -186,36 +423,47 @@ class CSVProcessor:
             output_path: 出力ファイルパス
         """
         output_config = self.config.get('output', {})
+        output_format = self.output_format
 
         # 既存ファイルの重複チェック
         if Path(output_path).exists():
             raise FileExistsError(f"出力ファイルが既に存在します: {output_path}")
 
         try:
-            df.to_csv(
-                output_path,
-                encoding=output_config.get('file_encoding', 'utf-8'),
-                sep=output_config.get('delimiter', ','),
-                index=False
-            )
-
-            self.logger.info(f"変換済みデータを保存しました: {output_path}")
-            self.logger.info(f"出力データ形状: {df.shape}")
+            if output_format == 'parquet':
+                df.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+            else:
+                df.to_csv(
+                    output_path,
+                    encoding=output_config.get('file_encoding', 'utf-8'),
+                    sep=output_config.get('delimiter', ','),
+                    index=False,
+                    compression='gzip' if output_format == 'csv.gz' else None
+                )
+
+            self.logger.info("変換済みデータを保存しました: %s", output_path)
+            self.logger.info("出力データ形状: %s", df.shape)
 
         except Exception as e:
             raise ValueError(f"CSVファイルの保存エラー: {e}")
 
-    def process(self, input_path: str, output_path: str) -> pd.DataFrame:
+    def process(self, input_path: str, output_path: str, backend: str = "pandas"):
         """
         全体の処理フローを実行
 
         Args:
             input_path: 入力ファイルパス
             output_path: 出力ファイルパス
+            backend: 処理バックエンド（"pandas" または "polars"）
 
         Returns:
-            DataFrame: 変換後のデータ
+            DataFrame: 変換後のデータ（polarsバックエンドの場合は polars.DataFrame）
         """
+        if backend == "polars":
+            return self._process_polars(input_path, output_path)
+        if backend != "pandas":
+            raise ValueError(f"未対応のバックエンドです: {backend}")
+
         self.logger.info("CSV処理を開始します")
 
         # データ読み込み
@@ -229,3 +477,182 @@ class CSVProcessor:
 
         self.logger.info("CSV処理が完了しました")
         return transformed_df
+
+    def process_streaming(self, input_path: str, output_path: str, chunk_rows: int = 200_000) -> Tuple[int, int]:
+        """
+        入力をチャンク単位で読み込み・変換・書き出しする（大きなファイル向け）
+
+        メモリ上には1チャンク分のデータのみを保持する。変換統計は全チャンク分を集計してログ出力する。
+        型推論はチャンクごとに行われるため、数値列の表記が一括処理と異なる場合がある。
+
+        Args:
+            input_path: 入力ファイルパス
+            output_path: 出力ファイルパス
+            chunk_rows: 1チャンクあたりの行数
+
+        Returns:
+            tuple: 出力データの（行数, 列数）
+        """
+        output_config = self.config.get('output', {})
+        output_format = self.output_format
+        if output_format == 'parquet':
+            raise ValueError("チャンク処理はparquet形式の出力に対応していません")
+
+        # 既存ファイルの重複チェック
+        if Path(output_path).exists():
+            raise FileExistsError(f"出力ファイルが既に存在します: {output_path}")
+
+        self.logger.info("CSV処理を開始します（チャンク処理: %d行単位）", chunk_rows)
+
+        mapping_stats = {
+            'total_transformations': 0,
+            'unmapped_items': pd.Index([], dtype=object)
+        }
+        n_rows = n_cols = 0
+
+        try:
+            reader = pd.read_csv(input_path, chunksize=chunk_rows, **self._csv_read_options())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"入力ファイルが見つかりません: {input_path}")
+        except Exception as e:
+            raise ValueError(f"CSVファイルの読み込みエラー: {e}")
+
+        try:
+            # BOM付きの文字コードでも先頭に1回だけ書き込まれるよう、出力ファイルは開いたまま追記する
+            open_output = gzip.open if output_format == 'csv.gz' else open
+            with reader, open_output(output_path, 'wt', encoding=output_config.get('file_encoding', 'utf-8'), newline='') as file:
+                for chunk in reader:
+                    transformed, chunk_stats = self._transform_with_stats(chunk)
+                    transformed.to_csv(
+                        file,
+                        sep=output_config.get('delimiter', ','),
+                        header=n_rows == 0,
+                        index=False
+                    )
+
+                    mapping_stats['total_transformations'] += chunk_stats['total_transformations']
+                    mapping_stats['unmapped_items'] = mapping_stats['unmapped_items'].union(chunk_stats['unmapped_items'])
+                    n_rows += len(transformed)
+                    n_cols = transformed.shape[1]
+        except Exception as e:
+            raise ValueError(f"CSVファイルのチャンク処理エラー: {e}")
+
+        # 統計情報をログ出力
+        mapping_stats['unmapped_items'] = sorted(mapping_stats['unmapped_items'].tolist())
+        self._log_mapping_stats(mapping_stats)
+
+        self.logger.info("変換済みデータを保存しました: %s", output_path)
+        self.logger.info("出力データ形状: (%d, %d)", n_rows, n_cols)
+        self.logger.info("CSV処理が完了しました")
+        return n_rows, n_cols
+
+    def _process_polars(self, input_path: str, output_path: str):
+        """
+        polarsを使用して全体の処理フローを実行
+
+        対象列のユニーク値ごとに変換結果を求め、列の置換はpolars側でまとめて実行する。
+        値は文字列のまま読み込むため、対象外の列も入力の表記のまま出力される。
+
+        Args:
+            input_path: 入力ファイルパス
+            output_path: 出力ファイルパス
+
+        Returns:
+            polars.DataFrame: 変換後のデータ
+        """
+        if pl is None:
+            raise ValueError("polarsバックエンドを使用するにはpolarsをインストールしてください")
+
+        input_config = self.config.get('input', {})
+        output_config = self.config.get('output', {})
+
+        output_format = self.output_format
+        output_encoding = output_config.get('file_encoding', 'utf-8')
+        if output_format != 'parquet' and output_encoding.lower().replace('-', '').replace('_', '') != 'utf8':
+            raise ValueError(f"polarsバックエンドはUTF-8以外の出力に対応していません: {output_encoding}")
+
+        # 既存ファイルの重複チェック
+        if Path(output_path).exists():
+            raise FileExistsError(f"出力ファイルが既に存在します: {output_path}")
+
+        self.logger.info("CSV処理を開始します（polars）")
+
+        encoding = input_config.get('file_encoding', 'utf-8')
+        read_options = {
+            'separator': input_config.get('delimiter', '\t'),
+            'skip_rows': input_config.get('header_row', 1) - 1,
+            'infer_schema': False  # 全ての列を文字列として読み込む
+        }
+
+        try:
+            if encoding.lower().replace('-', '').replace('_', '') == 'utf8':
+                # UTF-8の場合は遅延読み込み
+                lf = pl.scan_csv(input_path, **read_options)
+            else:
+                # scan_csvはUTF-8のみ対応のため、その他の文字コードは一括で読み込む
+                lf = pl.read_csv(input_path, encoding=encoding, **read_options).lazy()
+            columns = lf.collect_schema().names()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"入力ファイルが見つかりません: {input_path}")
+        except Exception as e:
+            raise ValueError(f"CSVファイルの読み込みエラー: {e}")
+
+        self.logger.info("CSVファイルを読み込みました: %s", input_path)
+        self.logger.info("列名: %s", columns)
+
+        target_columns = self._get_target_columns(columns)
+
+        mapping_stats = {
+            'total_transformations': 0,
+            'unmapped_items': []
+        }
+
+        lookup = {}
+        if target_columns:
+            # 対象列全体のユニーク値と出現回数を取得し、値ごとに1回だけマッピングを判定
+            value_counts = pl.concat(
+                [lf.select(pl.col(col).alias('value')) for col in target_columns]
+            ).drop_nulls().group_by('value').len().collect()
+
+            for value, count in value_counts.iter_rows():
+                transformed = self._apply_account_mapping(value)
+                lookup[value] = transformed
+                if transformed != value:
+                    mapping_stats['total_transformations'] += count
+                elif transformed != "":
+                    mapping_stats['unmapped_items'].append(transformed)
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                partial_matches = {
+                    value: general for value, general in lookup.items()
+                    if value.strip() not in self.account_mapping and general != value.strip()
+                }
+                if partial_matches:
+                    self.logger.debug("部分一致でのマッピング: %s", partial_matches)
+
+        # 空白のみの値は空文字になるが、polarsは空文字を "" と引用符付きで書き出すため
+        # pandas版と同じく空欄で出力されるよう欠損値に置き換える
+        replacements = {value: (transformed if transformed != "" else None) for value, transformed in lookup.items()}
+
+        try:
+            result = lf.with_columns(
+                [pl.col(col).replace(replacements) for col in target_columns]
+            ).collect()
+            if output_format == 'parquet':
+                result.write_parquet(output_path, compression='zstd')
+            elif output_format == 'csv.gz':
+                with gzip.open(output_path, 'wb') as file:
+                    result.write_csv(file, separator=output_config.get('delimiter', ','))
+            else:
+                result.write_csv(output_path, separator=output_config.get('delimiter', ','))
+        except Exception as e:
+            raise ValueError(f"CSVファイルの保存エラー: {e}")
+
+        # 統計情報をログ出力（ユニーク値ごとに判定しているため重複はない）
+        mapping_stats['unmapped_items'].sort()
+        self._log_mapping_stats(mapping_stats)
+
+        self.logger.info("変換済みデータを保存しました: %s", output_path)
+        self.logger.info("出力データ形状: %s", result.shape)
+        self.logger.info("CSV処理が完了しました")
+        return result